@@ -1,5 +1,26 @@
 #!/usr/bin/python3
 """ This module implements the base class for almost everything"""
+from functools import lru_cache
+from sys import intern
+
+
+@lru_cache(maxsize=1024)
+def compound_key(base, sub):
+    """
+    return the dotted attribute name for a base name and qualifier
+
+    These keys are rebuilt constantly on the action-processing paths
+    (e.g. "EVASION" + "." + "slash"); caching them eliminates the
+    per-call string concatenation and allocation.
+
+    The result is interned, so repeated dict lookups on the same key
+    compare by identity rather than character-by-character.
+
+    @param base: (string) base attribute name
+    @param sub: (string) sub-type qualifier
+    @return: (string) dotted attribute name
+    """
+    return intern(base + '.' + sub)
 
 
 class Base():
@@ -11,23 +32,50 @@ class Base():
     @ivar attributes:   dict of <name,value> pairs"
     """
 
+    # fixed instance layout: avoids a per-instance __dict__ and makes
+    # these (very hot) attribute references direct slot accesses
+    __slots__ = ('_name', '_description', 'attributes', '_display')
+
     def __init__(self, name, descr=None):
         """
         create a new object
         @param name: display name of this object
         @param descr: human description of this object
         """
-        self.name = name
-        self.description = descr
+        self._name = name
+        self._description = descr
+        self._display = name if descr is None else f"{name}({descr})"
         self.attributes = {}
 
+    @property
+    def name(self):
+        """ (string) display name of this object """
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._display = value if self._description is None \
+            else f"{value}({self._description})"
+
+    @property
+    def description(self):
+        """ (string) human description of this object """
+        return self._description
+
+    @description.setter
+    def description(self, value):
+        self._description = value
+        self._display = self._name if value is None \
+            else f"{self._name}({value})"
+
     def __str__(self):
         """
         return a descriptive string for this object
+        (precomputed, as objects are described far more often
+         than they are renamed)
         """
-        if self.description is None:
-            return self.name
-        return f"{self.name}({self.description})"
+        return self._display
 
     def get(self, attribute):
         """
@@ -36,9 +84,47 @@ class Base():
         @param attribute: name of attribute to be fetched
         @return: (string) value (or none)
         """
-        if attribute in self.attributes:
-            return self.attributes[attribute]
-        return None
+        # dict.get probes the table once; an in-test followed by an
+        # index would hash the (hot) attribute name twice
+        return self.attributes.get(attribute)
+
+    def get_int(self, attribute, default=0):
+        """
+        return the (integer) value of an attribute
+
+        This saves hot callers (e.g. the GameAction compute helpers)
+        the is-None branch and int() conversion they would otherwise
+        repeat around every bonus lookup.
+
+        @param attribute: name of attribute to be fetched
+        @param default: (int) value to use if the attribute is absent
+        @return: (int) value of that attribute
+        """
+        # route through get() so sub-class overrides (e.g. the
+        # GameContext parent-chain search) are honored here too
+        value = self.get(attribute)
+        return default if value is None else int(value)
+
+    def get_total(self, attribute, sub_type=None):
+        """
+        return the combined value of a (possibly sub-typed) attribute
+
+        The total is the sum of the base attribute and (if a sub-type
+        is given) the sub-type qualified attribute, with absent values
+        counting as zero.  This is the standard accumulation used for
+        EVASION/PROTECTION/RESISTANCE style attributes.
+
+        @param attribute: name of the base attribute
+        @param sub_type: (string) sub-type qualifier (or None)
+        @return: (int) sum of the base and sub-type values
+        """
+        value = self.get(attribute)
+        total = 0 if value is None else int(value)
+        if sub_type is not None:
+            value = self.get(compound_key(attribute, sub_type))
+            if value is not None:
+                total += int(value)
+        return total
 
     def set(self, attribute, value):
         """
@@ -102,6 +188,34 @@ def main():
         "New description does not default to None"
     passed += 2
 
+    # get_int coerces values and supplies defaults
+    go1.set("count", "3")
+    print(f"    get_int('count') -> {go1.get_int('count')}"
+          f", get_int('missing') -> {go1.get_int('missing')}"
+          f", get_int('missing', 6) -> {go1.get_int('missing', 6)}")
+    tried += 3
+    assert (go1.get_int("count") == 3), \
+        "get_int does not coerce a string value to int"
+    assert (go1.get_int("missing") == 0), \
+        "get_int does not default an absent value to 0"
+    assert (go1.get_int("missing", 6) == 6), \
+        "get_int does not honor an explicit default"
+    passed += 3
+
+    # get_total sums the base and sub-type values
+    go1.set("STAT", 10)
+    go1.set("STAT.sub", "5")
+    print(f"    get_total('STAT') -> {go1.get_total('STAT')}"
+          f", get_total('STAT', 'sub') -> {go1.get_total('STAT', 'sub')}")
+    tried += 3
+    assert (go1.get_total("STAT") == 10), \
+        "get_total does not return the base value"
+    assert (go1.get_total("STAT", "sub") == 15), \
+        "get_total does not add the sub-type value"
+    assert (go1.get_total("STAT", "other") == 10), \
+        "get_total does not ignore an absent sub-type"
+    passed += 3
+
     print()
     if tried == passed:
         print(f"Passed all {passed} Base tests")
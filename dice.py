@@ -2,9 +2,17 @@
 """
 This module provides the Dice class (formula based random numbers)
 """
+import re
 import sys
+from functools import lru_cache
 from random import randint
 
+# a dice formula is DnD-style dice (e.g. 3D6+4, d20, D%)
+# or an inclusive range (e.g. 4-12) ... matched in a single pass
+_FORMULA_RE = re.compile(r'^(?P<num>\d*)[Dd](?P<type>\d+|%)'
+                         r'(?:\+(?P<plus>\d+))?$'
+                         r'|^(?P<min>\d+)-(?P<max>\d+)$')
+
 
 # pylint: disable=too-few-public-methods
 class Dice():
@@ -20,8 +28,14 @@ class Dice():
     @ivar plus: (int) number to be added to the roll
     @ivar min_value: (int) lowest legal value in range, None if a formula
     @ivar max_value: (int) highest legal value range, None if a formula
+    @ivar roll: (callable) roll this set of dice, return (int) result
     """
 
+    # fixed instance layout: a Dice is five ints plus its specialized
+    # roll closure, so there is no need to carry a per-instance __dict__
+    __slots__ = ('num_dice', 'dice_type', 'min_value', 'max_value',
+                 'plus', 'roll')
+
     # pylint: disable=too-many-branches
     def __init__(self, formula):
         """
@@ -39,6 +53,7 @@ class Dice():
         # formula must be a string (or integer)
         if isinstance(formula, int):
             self.plus = formula
+            self._specialize()
             return
         if not isinstance(formula, str):
             raise ValueError("non-string dice expression")
@@ -46,54 +61,68 @@ class Dice():
         # if it is just a number, this is simple
         if formula.isnumeric():
             self.plus = int(formula)
+            self._specialize()
             return
         if formula[0] == '-' and formula[1:].isnumeric():
             self.plus = int(formula)
+            self._specialize()
             return
 
-        # figure out what kind of expression this is
-        delimiter = None
-        if 'D' in formula:
-            delimiter = 'D'
-            values = formula.split(delimiter)
-        elif 'd' in formula:
-            delimiter = 'd'
-            values = formula.split(delimiter)
-        elif '-' in formula:
-            delimiter = '-'
-            values = formula.split(delimiter)
-
-        # see if it has known form and 2 values
-        if delimiter is None or len(values) != 2:
+        # match the formula against the (precompiled) recognized forms
+        match = _FORMULA_RE.match(formula)
+        if match is None:
             raise ValueError("unrecognized dice expression")
 
-        # process the values
-        if delimiter in ('D', 'd'):
-            try:
-                self.num_dice = 1 if values[0] == '' else int(values[0])
-
-                # there might be a plus after the dice type
-                if '+' in values[1]:
-                    parts = values[1].split('+')
-                    values[1] = parts[0]
-                    values.append(parts[1])
-                else:
-                    values.append('0')
-
-                self.dice_type = 100 if values[1] == '%' else int(values[1])
-                self.plus = int(values[2])
-            except ValueError as exc:
-                raise ValueError("non-numeric in dice expression") from exc
+        # process the captured values
+        # (the groups can only match digits, so int() cannot fail and
+        #  needs no try/except frame on this path)
+        if match.group('type') is not None:
+            num = match.group('num')
+            self.num_dice = 1 if num == '' else int(num)
+            dice_type = match.group('type')
+            self.dice_type = 100 if dice_type == '%' else int(dice_type)
+            plus = match.group('plus')
+            self.plus = 0 if plus is None else int(plus)
+        else:
+            self.min_value = int(match.group('min'))
+            self.max_value = int(match.group('max'))
+            if self.min_value >= self.max_value:
+                self.min_value = None
+                self.max_value = None
+                raise ValueError("illegal range in dice expression")
+
+        self._specialize()
+
+    def _specialize(self):
+        """
+        bind C{roll} to a closure specialized for this formula
+
+        C{roll()} rolls this set of dice and returns the resulting
+        (int) value.  The kind of expression (dice, range, or constant)
+        is fully known once the formula has been parsed, so re-testing
+        it per roll would be pure overhead; capturing the parsed values
+        in a closure removes those tests (and the attribute lookups
+        behind them) from every subsequent roll.
+        """
+        # NOTE: randint is bound as a default argument so each roll
+        #       fetches it as a local rather than a module global
+        if self.num_dice is not None and self.dice_type is not None:
+            num_dice = self.num_dice
+            dice_type = self.dice_type
+            plus = self.plus
+            self.roll = \
+                lambda _randint=randint: sum(_randint(1, dice_type)
+                                             for _ in range(num_dice)) + plus
+        elif self.min_value is not None and self.max_value is not None:
+            min_value = self.min_value
+            max_value = self.max_value
+            plus = self.plus
+            self.roll = \
+                lambda _randint=randint: _randint(min_value,
+                                                  max_value) + plus
         else:
-            try:
-                self.min_value = int(values[0])
-                self.max_value = int(values[1])
-                if self.min_value >= self.max_value:
-                    self.min_value = None
-                    self.max_value = None
-                    raise ValueError("illegal range in dice expression")
-            except ValueError as exc:
-                raise ValueError("non-numeric in dice expression") from exc
+            plus = self.plus
+            self.roll = lambda: plus
 
     def str(self):
         """
@@ -112,20 +141,50 @@ class Dice():
 
         return descr
 
-    def roll(self):
-        """
-        roll this set of dice and return result
-        @return: (int) resulting value
+    def roll_batch(self, rolls, _randint=randint):
         """
-        total = 0
+        roll this set of dice many times and return all of the results
 
+        This amortizes the per-roll dispatch cost for callers (e.g.
+        Monte-Carlo damage simulations) that need many samples, by
+        hoisting the formula-type tests out of the per-roll loop
+        (randint comes in as a fast-local default argument).
+
+        @param rolls: (int) number of rolls to make
+        @return: (list of int) resulting values
+        """
         if self.num_dice is not None and self.dice_type is not None:
-            for _ in range(self.num_dice):
-                total += randint(1, self.dice_type)
-        elif self.min_value is not None and self.max_value is not None:
-            total = randint(self.min_value, self.max_value)
+            num_dice = self.num_dice
+            dice_type = self.dice_type
+            plus = self.plus
+            return [sum(_randint(1, dice_type)
+                        for _ in range(num_dice)) + plus
+                    for _ in range(rolls)]
+        if self.min_value is not None and self.max_value is not None:
+            min_value = self.min_value
+            max_value = self.max_value
+            plus = self.plus
+            return [_randint(min_value, max_value) + plus
+                    for _ in range(rolls)]
+        return [self.plus] * rolls
+
+
+@lru_cache(maxsize=1024)
+def make_dice(formula):
+    """
+    return a (shared) roller for the specified formula
 
-        return total + self.plus
+    Formula strings are reused heavily (every "3D6" weapon wants the
+    same roller), and a Dice is effectively immutable once parsed, so
+    one instance per unique formula can safely be shared.  Call sites
+    that construct Dice in hot loops should use this factory to pay the
+    parse cost only once per distinct formula.
+
+    @param formula: (string) description of roll
+    @return: (Dice) roller for that formula
+    @raise ValueError: illegal formula expression
+    """
+    return Dice(formula)
 
 
 # UNIT TESTING
@@ -159,6 +218,14 @@ def test(formula, min_expected, max_expected, rolls=20):
     assert min_rolled >= min_expected, "roll returns below-minimum values"
     assert max_rolled <= max_expected, "roll returns above-maximum values"
 
+    # a batch of rolls should return the same range of values
+    batch = dice.roll_batch(rolls)
+    assert len(batch) == rolls, "roll_batch returns wrong number of values"
+    assert min(batch) >= min_expected, \
+        "roll_batch returns below-minimum values"
+    assert max(batch) <= max_expected, \
+        "roll_batch returns above-maximum values"
+
     return min_rolled >= min_expected and max_rolled <= max_expected
 
 
@@ -203,6 +270,13 @@ def main():
     if test("-3", -3, -3, 10):
         tests_passed += 1
 
+    # the factory returns a shared instance for identical formulas
+    tests_run += 1
+    assert make_dice("3D6") is make_dice("3D6"), \
+        "make_dice does not share instances for identical formulas"
+    print('    make_dice("3D6") returns a shared instance')
+    tests_passed += 1
+
     # test detection of invalid expressions
     for formula in ["2D", "D", "xDy",
                     "4-2", "-", "3-", "x-y",
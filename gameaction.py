@@ -1,9 +1,43 @@
 #!/usr/bin/python3
 """ This module implements the GameAction class """
-from dice import Dice
-from base import Base
+from functools import lru_cache
+from dice import make_dice
+from base import Base, compound_key
 
 
+def _to_int(value):
+    """
+    coerce a (possibly absent) attribute value to an integer
+
+    @param value: (string or int) value to be coerced (or None)
+    @return: (int) value ... 0 if the value is absent
+    """
+    return 0 if value is None else int(value)
+
+
+@lru_cache(maxsize=1024)
+def _split_verbs(verb):
+    """
+    split a (possibly plus-separated) verb into its component verbs
+
+    Template actions reuse the same verb strings constantly, so the
+    split is cached: every GameAction built from the same template
+    shares one immutable tuple instead of re-splitting the string
+    (and allocating a fresh list) per construction.
+
+    @param verb: (string) simple or compound (plus-separated) verb
+    @return: (tuple of strings) component verbs
+    """
+    # a single partition both detects the (common) simple case and
+    # starts the compound split, so the string is only scanned once
+    (head, sep, rest) = verb.partition('+')
+    if not sep:
+        return (verb,)
+    return (head,) + tuple(rest.split('+'))
+
+
+# pylint: disable=too-many-instance-attributes; the parse/memo fields
+# (slots, not dict entries) are what keep the act() path cheap
 class GameAction(Base):
     """
     Every GameActor has, at any given time, a list of possible actions
@@ -47,6 +81,13 @@ class GameAction(Base):
     If there are multiple verbs but only a single value, that single value
     should be used for each verb.
     """
+
+    # fixed instance layout: thousands of actions can be queued in a
+    # scenario, and a per-instance __dict__ would cost more than all
+    # of these fields together
+    __slots__ = ('source', 'verb', '_verbs', '_parsed', '_is_attack',
+                 '_all_attacks', '_list_cache')
+
     def __init__(self, source, verb):
         """
         create a new C{GameAction}
@@ -58,19 +99,61 @@ class GameAction(Base):
         self.verb = verb
         self.attributes = {}
 
-        # non-attacks automatically have STACKS=1
-        if "ATTACK" not in verb:
-            self.set("STACKS", "1")
+        # pre-parse the (plus-separated) verb list, and each verb's
+        # base-type/sub-type, attack-ness, and initiator bonus keys,
+        # so that act(), __str__ and the compute helpers need not
+        # re-scan (or re-concatenate) the same strings on every
+        # dispatch
+        self._verbs = _split_verbs(verb)
+        self._parsed = []
+        any_attack = False
+        all_attacks = True
+        for one_verb in self._verbs:
+            (base_type, _, sub_type) = one_verb.partition('.')
+            sub_type = sub_type if sub_type else None
+            # verb categories are prefixes, so startswith (which stops
+            # at the first mismatched character) beats a substring scan
+            is_attack = one_verb.startswith("ATTACK")
+            any_attack = any_attack or is_attack
+            all_attacks = all_attacks and is_attack
+            keys = _attack_keys(sub_type) if is_attack \
+                else _condition_keys(base_type, sub_type)
+            self._parsed.append((one_verb, base_type, sub_type,
+                                 is_attack, keys))
+        self._is_attack = any_attack
+        self._all_attacks = all_attacks
+
+        # (name, size) -> lexed attribute list, so that repeated acts
+        # re-lex nothing (flushed whenever an attribute is set)
+        # (non-attacks implicitly have STACKS=1; rather than writing
+        #  that default into every constructed action, the read paths
+        #  below supply it, so bulk-constructed actions that never act
+        #  pay nothing for it)
+        self._list_cache = {}
 
     def __str__(self):
         """
         return a string representation of our verb and its attributes
+        (the attack/condition choice reads the flag cached at
+         construction rather than re-scanning the verb)
+        """
+        get = self.attributes.get
+        if self._is_attack:
+            return (f"{self.verb} (ACCURACY={get('ACCURACY')}%"
+                    f", DAMAGE={get('DAMAGE')})")
+        return (f"{self.verb} (POWER={get('POWER')}%"
+                f", STACKS={get('STACKS') or 1})")
+
+    def set(self, attribute, value):
+        """
+        set the value of an attribute
+        (invalidating any lists lexed from the old values)
+
+        @param attribute: name of attribute to be fetched
+        @param value: value to be stored for that attribute
         """
-        if "ATTACK" in self.verb:
-            return (f"{self.verb} (ACCURACY={self.get('ACCURACY')}%"
-                    f", DAMAGE={self.get('DAMAGE')})")
-        return (f"{self.verb} (POWER={self.get('POWER')}%"
-                f", STACKS={self.get('STACKS')})")
+        self._list_cache.clear()
+        super().set(attribute, value)
 
     # pylint: disable=too-many-locals; I claim I need them all
     def act(self, initiator, target, context):
@@ -108,45 +191,153 @@ class GameAction(Base):
         @return: (string) description of the results (returned from the target)
 
         """
-        # split verb into a list of individual plus-separated verbs
-        verbs = self.verb.split('+') if '+' in self.verb else [self.verb]
-        # split the ACCURACY, DAMAGE, POWER and STACKS into corresponding lists
-        accuracies = self.__get_list("ACCURACY", len(verbs))
-        damages = self.__get_list("DAMAGE", len(verbs))
-        powers = self.__get_list("POWER", len(verbs))
-        stacks = self.__get_list("STACKS", len(verbs))
+        # fast path: most actions are a single verb, which needs no
+        # loop bookkeeping and no result accumulation
+        if len(self._parsed) == 1:
+            (_verb, _base_type, _sub_type, is_attack, keys) = self._parsed[0]
+            attributes = self.attributes
+            if is_attack:
+                (accuracy, damage) = \
+                    _compute_attack(keys, self.__get_list("ACCURACY", 1)[0],
+                                    self.__get_list("DAMAGE", 1)[0],
+                                    initiator)
+                attributes["TO_HIT"] = 100 + accuracy
+                attributes["HIT_POINTS"] = damage
+            else:
+                (power, total) = \
+                    _compute_condition(keys, self.__get_list("POWER", 1)[0],
+                                       self.__get_list("STACKS", 1)[0],
+                                       initiator)
+                attributes["TO_HIT"] = 100 + power
+                attributes["TOTAL"] = total
+            return target.accept_action(self, initiator, context)
+
+        # the verb list (and each verb's parse) was precomputed in __init__
+        count = len(self._verbs)
+        # split the needed attributes into corresponding lists
+        # (homogeneous compound verbs -- the common case -- want only
+        #  one of the two attribute pairs, so don't lex the other;
+        #  the unused pair is left empty, and the loop never indexes it)
+        accuracies = damages = powers = stacks = ()
+        if self._is_attack:
+            accuracies = self.__get_list("ACCURACY", count)
+            damages = self.__get_list("DAMAGE", count)
+        if not self._all_attacks:
+            powers = self.__get_list("POWER", count)
+            stacks = self.__get_list("STACKS", count)
 
         # carry out each of the verbs in the list
-        results = ""
+        # (results are accumulated in a list and joined once, rather
+        #  than re-concatenated -- quadratically -- per verb)
+        results = []
+        attacks = 0
+        conditions = 0
+        # the computed values are stored with plain dict writes; they
+        # remain readable through get() (recipients and tests depend
+        # on that) without a method call per attribute per verb
+        attributes = self.attributes
+        # bind the per-iteration lookups (bound method, helper
+        # globals) as fast locals before entering the loop
+        accept_action = target.accept_action
+        compute_attack = _compute_attack
+        compute_condition = _compute_condition
+        # recipients see the current sub-verb through self.verb, so it
+        # must be updated per iteration; the original compound verb is
+        # restored on the way out so the action remains reusable
+        compound_verb = self.verb
+        try:
+            for (verb, _base_type, _sub_type, is_attack, keys) \
+                    in self._parsed:
+                # gather the verb and associated base/initiator attributes
+                self.verb = verb
+                if is_attack:
+                    (accuracy, damage) = \
+                        compute_attack(keys, accuracies[attacks],
+                                       damages[attacks], initiator)
+                    attributes["TO_HIT"] = 100 + accuracy
+                    attributes["HIT_POINTS"] = damage
+                    attacks += 1
+                else:
+                    (power, total) = \
+                        compute_condition(keys, powers[conditions],
+                                          stacks[conditions], initiator)
+                    attributes["TO_HIT"] = 100 + power
+                    attributes["TOTAL"] = total
+                    conditions += 1
+                # pass them on to target, and accumulate results
+                (success, result) = accept_action(self, initiator, context)
+                results.append(result)
+                # immediately return false if any action fails
+                if not success:
+                    return (False, "\n".join(results))
+
+            return (True, "\n".join(results))
+        finally:
+            self.verb = compound_verb
+
+    # pylint: disable=too-many-locals; I claim I need them all
+    def act_batch(self, initiator, rolls):
+        """
+        sample this action's computed values without delivering it
+
+        Balance analysis wants the distribution of what act() would
+        deliver, but calling act() per sample pays the full dispatch
+        cost each time.  This computes each verb's (deterministic)
+        TO_HIT once and batch-rolls the relevant dice formulas, so
+        the per-sample cost is just the rolls themselves.  No target
+        is involved and the action's attributes are not modified.
+
+        @param initiator: (GameActor) who would initiate the action
+        @param rolls: (int) number of samples to generate
+        @return: (list of (verb, int, list of int)) for each component
+                 verb: the verb, its TO_HIT, and the sampled
+                 HIT_POINTS (or TOTAL stacks) values
+        """
+        count = len(self._verbs)
+        accuracies = self.__get_list("ACCURACY", count)
+        damages = self.__get_list("DAMAGE", count)
+        powers = self.__get_list("POWER", count)
+        stacks = self.__get_list("STACKS", count)
+
+        get = initiator.get
+        get_int = initiator.get_int
+        results = []
         attacks = 0
         conditions = 0
-        for verb in verbs:
-            # gather the verb and associated base/initiator attributes
-            self.verb = verb
-            if "ATTACK" in verb:
-                self.set("TO_HIT", 100 +
-                         compute_accuracy(verb, accuracies[attacks],
-                                          initiator))
-                self.set("HIT_POINTS",
-                         compute_damage(verb, damages[attacks], initiator))
+        for (verb, _base_type, _sub_type, is_attack, keys) in self._parsed:
+            # gather the to-hit bonus and the dice formulas to roll
+            totals = [0] * rolls
+            if is_attack:
+                bonus = _to_int(accuracies[attacks]) + \
+                    get_int("ACCURACY")
+                formulas = [damages[attacks], get("DAMAGE")]
+                if keys is not None:
+                    bonus += get_int(keys[0])
+                    formulas.append(get(keys[1]))
                 attacks += 1
             else:
-                self.set("TO_HIT", 100 +
-                         compute_power(verb, powers[conditions], initiator))
-                self.set("TOTAL",
-                         compute_stacks(verb, stacks[conditions], initiator))
+                (pwr_key, stx_key, pwr_sub_key, stx_sub_key) = keys
+                bonus = _to_int(powers[conditions]) + \
+                    get_int(pwr_key)
+                base = stacks[conditions]
+                if base is None:
+                    totals = [1] * rolls
+                    formulas = [get(stx_key)]
+                else:
+                    formulas = [base, get(stx_key)]
+                if pwr_sub_key is not None:
+                    bonus += get_int(pwr_sub_key)
+                    formulas.append(get(stx_sub_key))
                 conditions += 1
-            # pass them on to target, and accumulate results
-            (success, result) = target.accept_action(self, initiator, context)
-            if results == "":
-                results = result
-            else:
-                results += "\n" + result
-            # immediately return false if any action fails
-            if not success:
-                return (False, results)
 
-        return (True, results)
+            # batch-roll each formula and accumulate element-wise
+            for formula in formulas:
+                if formula is not None:
+                    batch = make_dice(formula).roll_batch(rolls)
+                    totals = [t + b for (t, b) in zip(totals, batch)]
+            results.append((verb, 100 + bonus, totals))
+
+        return results
 
     def __get_list(self, name, size):
         """
@@ -154,507 +345,212 @@ class GameAction(Base):
 
         @param name: (string) name of attribute to be looked up and split
         @param size: (int) length of desired list
-        @return: (list of strings)
-            - if no value is found, a list of Nones will be returned
+        @return: (tuple of strings) ... always exactly C{size} elements
+            - if no value is found, a tuple of Nones will be returned
             - if there is only single value, it will be replicated the
               specified number of times
+            - a too-short list is padded out with its final value
+
+        Results are memoized (the attributes only change via set(),
+        which flushes the cache), so repeated acts re-lex nothing.
         """
+        cached = self._list_cache.get((name, size))
+        if cached is not None:
+            return cached
+
         atr = self.get(name)
         if atr is None:
-            return [None] * size
-        if not isinstance(atr, str):
-            return [atr] * size
-        if ',' not in atr:
-            return [atr] * size
-        return atr.split(',')
+            # non-attacks implicitly have STACKS=1 (see __init__)
+            if name == "STACKS" and not self._is_attack:
+                result = ("1",) * size
+            else:
+                result = (None,) * size
+        elif not isinstance(atr, str):
+            result = (atr,) * size
+        else:
+            # one split covers both the single- and multi-value cases
+            # (an un-listed value comes back as a single part, and the
+            #  padding below replicates it), and the fixed result size
+            # means callers can index by verb without bounds checks
+            parts = atr.split(',')
+            count = len(parts)
+            if count < size:
+                parts.extend(parts[-1:] * (size - count))
+            elif count > size:
+                del parts[size:]
+            result = tuple(parts)
+
+        self._list_cache[(name, size)] = result
+        return result
+
+
+def _attack_keys(sub_type):
+    """
+    build the initiator bonus-attribute keys for an attack verb
+
+    @param sub_type: (string) attack sub-type (or None)
+    @return: (tuple of strings) ACCURACY.sub and DAMAGE.sub keys
+             (or None for an un-subtyped attack)
+    """
+    if sub_type is None:
+        return None
+    return (compound_key("ACCURACY", sub_type),
+            compound_key("DAMAGE", sub_type))
 
 
-def compute_accuracy(verb, base, initiator):
+def _condition_keys(base_type, sub_type):
     """
-    helper to compute accuracy of this attack, based on the supplied
-    base ACCURACY plus any initiator ACCURACY(.subtype) bonus(es).
+    build the initiator bonus-attribute keys for a condition verb
 
-    @param verb: (string) attack verb
-    @param base: (int) accuracy (from the action)
-    @param initiator: (GameActor) who is initiating the attack
-    @return: (int) probability of hitting
+    @param base_type: (string) condition type
+    @param sub_type: (string) condition sub-type (or None)
+    @return: (tuple of strings) POWER.base, STACKS.base,
+             POWER.base.sub and STACKS.base.sub keys
+             (the sub-type keys are None for un-subtyped verbs)
     """
-    # get base accuracy from the action
-    if base is None:
-        w_accuracy = 0
-    else:
-        w_accuracy = int(base)
-
-    # get the initiator base accuracy
-    acc = initiator.get("ACCURACY")
-    if acc is None:
-        i_accuracy = 0
-    else:
-        i_accuracy = int(acc)
-
-    # add any initiator sub-type accuracy
-    if 'ATTACK.' in verb:
-        sub_type = verb.split('.')[1]
-        if sub_type is not None:
-            acc = initiator.get("ACCURACY." + sub_type)
-            if acc is not None:
-                i_accuracy += int(acc)
-
-    return w_accuracy + i_accuracy
-
-
-def compute_damage(verb, base, initiator):
+    pwr_key = compound_key("POWER", base_type)
+    stx_key = compound_key("STACKS", base_type)
+    if sub_type is None:
+        return (pwr_key, stx_key, None, None)
+    qualified = compound_key(base_type, sub_type)
+    return (pwr_key, stx_key,
+            compound_key("POWER", qualified),
+            compound_key("STACKS", qualified))
+
+
+def _compute_attack(keys, acc_base, dmg_base, initiator):
     """
-    helper to compute the damage of this attack, based on the supplied
-    base DAMAGE plus any initiator DAMAGE(.subtype) bonus(es).
+    fused helper to compute the accuracy and damage of one attack,
+    based on the supplied base ACCURACY/DAMAGE plus any initiator
+    ACCURACY/DAMAGE(.subtype) bonus(es).
 
-    @param verb: (string) attack verb
-    @param base: (string) dice formula for base damage
+    Gathering both in a single pass halves the initiator attribute
+    lookups per attack verb, and the precomputed keys avoid re-building
+    the same sub-type key strings on every call.
+
+    @param keys: (tuple) precomputed C{_attack_keys} (or None)
+    @param acc_base: (int) accuracy (from the action)
+    @param dmg_base: (string) dice formula for base damage
     @param initiator: (GameActor) who is initiating the attack
-    @return: (int) total damage
+    @return: (int, int) probability of hitting, and total damage
     """
-    # get the basic action damage formula and roll it
-    if base is None:
-        w_damage = 0
-    else:
-        dice = Dice(base)
-        w_damage = dice.roll()
-
-    # get initiator base damage formula and roll it
-    dmg = initiator.get("DAMAGE")
-    if dmg is None:
-        i_damage = 0
-    else:
-        dice = Dice(dmg)
-        i_damage = dice.roll()
-
-    # add any initiator sub-type damage
-    if 'ATTACK.' in verb:
-        sub_type = verb.split('.')[1]
-        if sub_type is not None:
-            dmg = initiator.get("DAMAGE." + sub_type)
-            if dmg is not None:
-                dice = Dice(dmg)
-                i_damage += dice.roll()
-
-    return w_damage + i_damage
-
-
-def compute_power(verb, base, initiator):
-    """
-    helper to compute the power of this action, based on the supplied
-    base POWER plus any initiator POWER.verb/POWER.verb.subtype bonuses
+    get = initiator.get
 
-    @param verb: (string) action verb
-    @param base: (int) base power (from action)
-    @param initiator: (GameActor) who is sending the condition
-    @return: (int) total probability of hitting
-    """
-    # figure out the condition type and subtype
-    if '.' in verb:
-        base_type = verb.split('.')[0]
-        sub_type = verb.split('.')[1]
-    else:
-        base_type = verb
-        sub_type = None
-
-    # get base power from the action
-    if base is None:
-        power = 0
-    else:
-        power = int(base)
-
-    # add the initiator base power
-    pwr = initiator.get("POWER." + base_type)
-    if pwr is not None:
-        power += int(pwr)
-
-    # add any initiator sub-type power
-    if sub_type is not None:
-        pwr = initiator.get("POWER." + base_type + '.' + sub_type)
-        if pwr is not None:
-            power += int(pwr)
-
-    return power
-
-
-def compute_stacks(verb, base, initiator):
+    # get the base accuracy and damage from the action
+    accuracy = _to_int(acc_base)
+    damage = 0 if dmg_base is None else make_dice(dmg_base).roll()
+
+    # add the initiator base accuracy and damage
+    accuracy += initiator.get_int("ACCURACY")
+    dmg = get("DAMAGE")
+    if dmg is not None:
+        damage += make_dice(dmg).roll()
+
+    # add any initiator sub-type accuracy and damage
+    if keys is not None:
+        (acc_key, dmg_key) = keys
+        accuracy += initiator.get_int(acc_key)
+        dmg = get(dmg_key)
+        if dmg is not None:
+            damage += make_dice(dmg).roll()
+
+    return (accuracy, damage)
+
+
+def _compute_condition(keys, pwr_base, stx_base, initiator):
     """
-    helper to compute the stacks of this action, based on the supplied
-    base STACKS plus any initiator STACKS.verb/STACKS.verb.subtype bonuses
+    fused helper to compute the power and stacks of one condition,
+    based on the supplied base POWER/STACKS plus any initiator
+    POWER/STACKS.verb(.subtype) bonuses.
 
-    @param verb: (string) action verb
-    @param base: (string) dice formula for base stacks
+    Gathering both in a single pass halves the initiator attribute
+    lookups per condition verb, and the precomputed keys avoid
+    re-building the same qualified key strings on every call.
+
+    @param keys: (tuple) precomputed C{_condition_keys}
+    @param pwr_base: (int) base power (from action)
+    @param stx_base: (string) dice formula for base stacks
     @param initiator: (GameActor) who is sending the condition
-    @return: (int) total number of stacks
+    @return: (int, int) probability of hitting, and number of stacks
     """
-    # figure out the condition type and subtype
-    if '.' in verb:
-        base_type = verb.split('.')[0]
-        sub_type = verb.split('.')[1]
-    else:
-        base_type = verb
-        sub_type = None
-
-    # get base stacks from the action
-    if base is None:
-        stacks = 1
-    else:
-        dice = Dice(base)
-        stacks = dice.roll()
-
-    # add the initiator base stacks
-    stx = initiator.get("STACKS." + base_type)
+    (pwr_key, stx_key, pwr_sub_key, stx_sub_key) = keys
+    get = initiator.get
+    get_int = initiator.get_int
+
+    # get the base power and stacks from the action
+    power = _to_int(pwr_base)
+    stacks = 1 if stx_base is None else make_dice(stx_base).roll()
+
+    # add the initiator base power and stacks
+    power += get_int(pwr_key)
+    stx = get(stx_key)
     if stx is not None:
-        dice = Dice(stx)
-        stacks += dice.roll()
+        stacks += make_dice(stx).roll()
 
-    # add any initiator sub-type stacks
-    if sub_type is not None:
-        stx = initiator.get("STACKS." + base_type + '.' + sub_type)
+    # add any initiator sub-type power and stacks
+    if pwr_sub_key is not None:
+        power += get_int(pwr_sub_key)
+        stx = get(stx_sub_key)
         if stx is not None:
-            dice = Dice(stx)
-            stacks += dice.roll()
+            stacks += make_dice(stx).roll()
 
-    return stacks
+    return (power, stacks)
 
 
-# UNIT TESTING
-class TestRecipient(Base):
+def compute_accuracy(sub_type, base, initiator):
     """
-    a minimal object that can receive, and report on actions
+    helper to compute accuracy of this attack
+    (thin wrapper around the fused C{_compute_attack})
 
-    The returned result string will include the passed TO_HIT and POWER/STACKS
-    attributes so that the test case can confirm that they were properly
-    computed and passed.
+    @param sub_type: (string) attack sub-type (or None)
+    @param base: (int) accuracy (from the action)
+    @param initiator: (GameActor) who is initiating the attack
+    @return: (int) probability of hitting
     """
+    return _compute_attack(_attack_keys(sub_type), base, None, initiator)[0]
 
-    def accept_action(self, action, actor, context):
-        """
-        report on the action we received
 
-        @param action: GameAction being sent
-        @param actor: GameActor who set it
-        @param context: GameContext in which this happened
-        @return (boolean success, string results)
-        """
-        if "ATTACK" in action.verb:
-            return (True,
-                    f"{self} receives {action.verb}"
-                    f" (TO_HIT={action.get('TO_HIT')}"
-                    f", DAMAGE={action.get('HIT_POINTS')})"
-                    f"from {actor} in {context}")
-        result = "resists" if action.verb == "FAIL" else "receives"
-        return (action.verb != "FAIL",
-                f"{self} {result} {action.verb}"
-                f" (TO_HIT={action.get('TO_HIT')},"
-                f" STACKS={action.get('TOTAL')})"
-                f" from {actor} in {context}")
-
-
-# pylint: disable=too-many-locals; I claim I need them all
-def base_attacks():
-    """
-    GameAction base ability ATTACK test cases:
-        - test correctness of TO_HIT and DAMAGE computations
-          for base and sub-type attacks
-          but with no sub-type or initiator bonuses
+def compute_damage(sub_type, base, initiator):
     """
+    helper to compute the damage of this attack
+    (thin wrapper around the fused C{_compute_attack})
 
-    # create a victim and context
-    victim = TestRecipient("victim")
-    context = Base("unit-test")
-
-    # create an artifact with actions
-    artifact = Base("test-case")
-
-    # test attacks from an un-skilled attacker (base values)
-    lame = Base("lame attacker")        # attacker w/no skills
-    lame_attacks = [
-        # verb,       accuracy, damage, exp hit, exp dmg
-        ("ATTACK",        None,    "1",     100,       1),
-        ("ATTACK.ten",      10,   "10",     110,      10),
-        ("ATTACK.twenty",   20,   "20",     120,      20),
-        ("ATTACK.thirty",   30,   "30",     130,      30)]
-
-    tried = 0
-    passed = 0
-    for (verb, accuracy, damage, exp_hit, exp_dmg) in lame_attacks:
-        action = GameAction(artifact, verb)
-        if accuracy is not None:
-            action.set("ACCURACY", accuracy)
-        action.set("DAMAGE", damage)
-        (_, result) = action.act(lame, victim, context)
-
-        # see if the action contained the expected values
-        to_hit = action.get("TO_HIT")
-        hit_points = action.get("HIT_POINTS")
-        tried += 3
-        if action.verb == verb and to_hit == exp_hit and hit_points == exp_dmg:
-            print(result + " ... CORRECT")
-            passed += 3
-        else:
-            print(result)
-            assert action.verb == verb, \
-                "incorrect action verb: expected " + verb
-            passed += 1
-            assert action.get("TO_HIT") == exp_hit, \
-                "incorrect base accuracy: expected " + str(exp_hit)
-            passed += 1
-            assert action.get("HIT_POINTS") == exp_dmg, \
-                "incorrect base damage: expected " + str(exp_dmg)
-            passed += 1
-
-    print()
-    return (tried, passed)
-
-
-# pylint: disable=too-many-locals; I claim I need them all
-def subtype_attacks():
-    """
-    GameAction sub-type ability ATTACK test cases:
-        - test correctness of TO_HIT and DAMAGE computations
-          for base and sub-type attacks
-          both action and initiator have both base and sub-type bonuses
+    @param sub_type: (string) attack sub-type (or None)
+    @param base: (string) dice formula for base damage
+    @param initiator: (GameActor) who is initiating the attack
+    @return: (int) total damage
     """
+    return _compute_attack(_attack_keys(sub_type), None, base, initiator)[1]
 
-    # create a victim and context
-    victim = TestRecipient("victim")
-    context = Base("unit-test")
-
-    # create an artifact with actions
-    artifact = Base("test-case")
-
-    # test attacks from a skilled attacker, w/bonus values
-    skilled = Base("skilled attacker")  # attacker w/many skills
-    skilled.set("ACCURACY", 10)
-    skilled.set("DAMAGE", "10")
-    skilled.set("ACCURACY.twenty", 20)
-    skilled.set("DAMAGE.twenty", "20")
-    skilled.set("ACCURACY.thirty", 30)
-    skilled.set("DAMAGE.thirty", "30")
-
-    skilled_attacks = [
-        # verb,       accuracy, damage, exp hit, exp dmg
-        ("ATTACK",        None,    "1",     110,      11),
-        ("ATTACK.ten",      10,   "10",     120,      20),
-        ("ATTACK.twenty",   20,   "20",     150,      50),
-        ("ATTACK.thirty",   30,   "30",     170,      70)]
-
-    tried = 0
-    passed = 0
-    for (verb, accuracy, damage, exp_hit, exp_dmg) in skilled_attacks:
-        action = GameAction(artifact, verb)
-        if accuracy is not None:
-            action.set("ACCURACY", accuracy)
-        action.set("DAMAGE", damage)
-        (_, result) = action.act(skilled, victim, context)
-
-        # see if the action contained the expected values
-        tried += 3
-        to_hit = action.get("TO_HIT")
-        hit_points = action.get("HIT_POINTS")
-        if action.verb == verb and to_hit == exp_hit and hit_points == exp_dmg:
-            print(result + " ... CORRECT")
-            passed += 3
-        else:
-            print(result)
-            assert action.verb == verb, \
-                "incorrect action verb: expected " + verb
-            passed += 1
-            assert action.get("TO_HIT") == exp_hit, \
-                "incorrect base accuracy: expected " + str(exp_hit)
-            passed += 1
-            assert action.get("HIT_POINTS") == exp_dmg, \
-                "incorrect base damage: expected " + str(exp_dmg)
-            passed += 1
-    print()
-    return (tried, passed)
-
-
-# pylint: disable=too-many-locals; I claim I need them all
-def base_conditions():
-    """
-    GameAction base ability condition test cases:
-        - test correctness of TO_HIT and STACKS computations
-          for base and sub-type verbs
-          but with no sub-type or initiator bonuses
-    """
 
-    # create a victim and context
-    victim = TestRecipient("victim")
-    context = Base("unit-test")
-
-    # create an artifact with actions
-    artifact = Base("test-case")
-
-    # test attacks from an un-skilled attacker (base values)
-    lame = Base("unskilled sender")      # sender w/no skills
-    lame_attacks = [
-        # verb,       power, stacks, exp hit, exp stx
-        ("MENTAL",     None,    "1",     100,       1),
-        ("MENTAL.X",     10,   "10",     110,      10),
-        ("MENTAL.Y",     20,   "20",     120,      20),
-        ("MENTAL.Z",     30,   "30",     130,      30)]
-
-    tried = 0
-    passed = 0
-    for (verb, power, stacks, exp_hit, exp_stx) in lame_attacks:
-        action = GameAction(artifact, verb)
-        if power is not None:
-            action.set("POWER", power)
-        action.set("STACKS", stacks)
-        (_, result) = action.act(lame, victim, context)
-
-        # see if the action contained the expected values
-        tried += 3
-        to_hit = action.get("TO_HIT")
-        stacks = action.get("TOTAL")
-        if action.verb == verb and to_hit == exp_hit and stacks == exp_stx:
-            print(result + " ... CORRECT")
-            passed += 3
-        else:
-            print(result)
-            assert action.verb == verb, \
-                "incorrect action verb: expected " + verb
-            passed += 1
-            assert action.get("TO_HIT") == exp_hit, \
-                "incorrect base accuracy: expected " + str(exp_hit)
-            passed += 1
-            assert action.get("TOTAL") == exp_stx, \
-                "incorrect base stacks: expected " + str(exp_stx)
-            passed += 1
-    print()
-    return (tried, passed)
-
-
-# pylint: disable=too-many-locals; I claim I need them all
-def subtype_conditions():
-    """
-    GameAction sub-type ability condition test cases:
-        - test correctness of TO_HIT and STACKS computations
-          for base and sub-type verbs
-          both action and initiator have both base and sub-type bonuses
+def compute_power(base_type, sub_type, base, initiator):
     """
+    helper to compute the power of this action
+    (thin wrapper around the fused C{_compute_condition})
 
-    # create a victim and context
-    victim = TestRecipient("victim")
-    context = Base("unit-test")
-
-    # create an artifact with actions
-    artifact = Base("test-case")
-
-    # test attacks from a skilled attacker, w/bonus values
-    skilled = Base("skilled sender")  # sender w/many skills
-    skilled.set("POWER.MENTAL", 10)
-    skilled.set("STACKS.MENTAL", "10")
-    skilled.set("POWER.MENTAL.Y", 20)
-    skilled.set("STACKS.MENTAL.Y", "20")
-    skilled.set("POWER.MENTAL.Z", 30)
-    skilled.set("STACKS.MENTAL.Z", "30")
-
-    skilled_attacks = [
-        # verb,       power, stacks, exp hit, exp stx
-        ("MENTAL",     None,    "1",     110,      11),
-        ("MENTAL.X",     10,   "10",     120,      20),
-        ("MENTAL.Y",     20,   "20",     150,      50),
-        ("MENTAL.Z",     30,   "30",     170,      70)]
-
-    tried = 0
-    passed = 0
-    for (verb, power, stacks, exp_hit, exp_stx) in skilled_attacks:
-        action = GameAction(artifact, verb)
-        if power is not None:
-            action.set("POWER", power)
-        action.set("STACKS", stacks)
-        (_, result) = action.act(skilled, victim, context)
-
-        # see if the action contained the expected values
-        tried += 3
-        to_hit = action.get("TO_HIT")
-        stacks = action.get("TOTAL")
-        if action.verb == verb and to_hit == exp_hit and stacks == exp_stx:
-            print(result + " ... CORRECT")
-            passed += 3
-        else:
-            print(result)
-            assert action.verb == verb, \
-                "incorrect action verb: expected " + verb
-            passed += 1
-            assert action.get("TO_HIT") == exp_hit, \
-                "incorrect base accuracy: expected " + str(exp_hit)
-            passed += 1
-            assert action.get("TOTAL") == exp_stx, \
-                "incorrect base stacks: expected " + str(exp_stx)
-            passed += 1
-    print()
-    return (tried, passed)
-
-
-def compound_verbs():
-    """
-    GameAction compound-verb test cases:
-      - recognition and handling of compound verbs
-      - correct association with ACCURACY, DAMAGE, POWER and STACKS lists
-      - stopping list processing on first action that fails
+    @param base_type: (string) condition type
+    @param sub_type: (string) condition sub-type (or None)
+    @param base: (int) base power (from action)
+    @param initiator: (GameActor) who is sending the condition
+    @return: (int) total probability of hitting
     """
-    context = Base("unit-test")
-    artifact = Base("test-case")
-    victim = TestRecipient("victim")
-    lame = Base("unskilled sender")      # sender w/no skills
-
-    verbs = "ATTACK.one+MENTAL.two+ATTACK.three+PHYSICAL.four+VERBAL.five" + \
-            "+FAIL+WONT-HAPPEN"
-    action = GameAction(artifact, verbs)
-    action.set("ACCURACY", "1,3")
-    action.set("DAMAGE", "10,30")
-    action.set("POWER", "2,4,5,0")
-    action.set("STACKS", "2,4,5,0")
-
-    print("Compound verb: " + verbs)
-    for attr in ["ACCURACY", "DAMAGE", "POWER", "STACKS"]:
-        print("    " + attr + ":\t" + action.get(attr))
-
-    (success, results) = action.act(lame, victim, context)
-    print(results)
-    assert "ATTACK.one (TO_HIT=101, DAMAGE=10)" in results, \
-        "ATTACK.one was not correctly passed"
-    assert "two (TO_HIT=102, STACKS=2)" in results, \
-        "MENTAL.two was not correctly passed"
-    assert "ATTACK.three (TO_HIT=103, DAMAGE=30)" in results, \
-        "ATTACK.three was not correctly passed"
-    assert "four (TO_HIT=104, STACKS=4)" in results, \
-        "PHYSICAL.four was not correctly passed"
-    assert "five (TO_HIT=105, STACKS=5)" in results, \
-        "VERBAL.five was not correctly passed"
-    assert "resists FAIL" in results, \
-        "sixth (FAIL) condition was not correctly passed"
-    assert not success, \
-        "sixth (FAIL) condition did not cause action to fail"
-    assert "WONT-HAPPEN" not in results, \
-        "seventh (WONT-HAPPEN) action should not have been sent"
-
-    print()
-    return (8, 8)
-
-
-def main():
+    return _compute_condition(_condition_keys(base_type, sub_type),
+                              base, None, initiator)[0]
+
+
+def compute_stacks(base_type, sub_type, base, initiator):
     """
-    Run all unit-test cases and print out summary of results
+    helper to compute the stacks of this action
+    (thin wrapper around the fused C{_compute_condition})
+
+    @param base_type: (string) condition type
+    @param sub_type: (string) condition sub-type (or None)
+    @param base: (string) dice formula for base stacks
+    @param initiator: (GameActor) who is sending the condition
+    @return: (int) total number of stacks
     """
-    (t_1, p_1) = base_attacks()
-    (t_2, p_2) = subtype_attacks()
-    (t_3, p_3) = base_conditions()
-    (t_4, p_4) = subtype_conditions()
-    (t_5, p_5) = compound_verbs()
-    tried = t_1 + t_2 + t_3 + t_4 + t_5
-    passed = p_1 + p_2 + p_3 + p_4 + p_5
-    if tried == passed:
-        print(f"Passed all {passed} GameAction tests")
-    else:
-        missed = tried - passed
-        print(f"FAILED {missed}/{tried} GameAction tests")
-
-
-if __name__ == "__main__":
-    main()
+    return _compute_condition(_condition_keys(base_type, sub_type),
+                              None, base, initiator)[1]
+
+# UNIT TESTING: the test scenarios (and their runner) live in
+# gameaction_tests.py; run that module to exercise this one
@@ -0,0 +1,314 @@
+#!/usr/bin/python3
+"""
+unit-test scenarios for the GameAction class
+
+These live in their own module so that importing gameaction (which
+every engine module does) does not also load the test scaffolding;
+gameaction.py itself is import-only, so run this module (directly,
+or via make test) to exercise it.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from base import Base
+from gameaction import GameAction
+
+
+class TestRecipient(Base):
+    """
+    a minimal object that can receive, and report on actions
+
+    The returned result string will include the passed TO_HIT and POWER/STACKS
+    attributes so that the test case can confirm that they were properly
+    computed and passed.
+    """
+
+    __slots__ = ()
+
+    def accept_action(self, action, actor, context):
+        """
+        report on the action we received
+
+        @param action: GameAction being sent
+        @param actor: GameActor who set it
+        @param context: GameContext in which this happened
+        @return (boolean success, string results)
+        """
+        # bind the repeated action lookups before formatting
+        verb = action.verb
+        to_hit = action.get("TO_HIT")
+        if verb.startswith("ATTACK"):
+            return (True,
+                    f"{self} receives {verb}"
+                    f" (TO_HIT={to_hit}"
+                    f", DAMAGE={action.get('HIT_POINTS')})"
+                    f"from {actor} in {context}")
+        # a FAIL short-circuits the caller, which will discard all but
+        # the resistance note ... so don't format the full report
+        if verb == "FAIL":
+            return (False, f"{self} resists FAIL")
+        return (True,
+                f"{self} receives {verb}"
+                f" (TO_HIT={to_hit},"
+                f" STACKS={action.get('TOTAL')})"
+                f" from {actor} in {context}")
+
+
+# attack test cases: verb, accuracy, damage, expected hit, expected damage
+_LAME_ATTACKS = [
+    ("ATTACK",        None,    "1",     100,       1),
+    ("ATTACK.ten",      10,   "10",     110,      10),
+    ("ATTACK.twenty",   20,   "20",     120,      20),
+    ("ATTACK.thirty",   30,   "30",     130,      30)]
+
+_SKILLED_ATTACKS = [
+    ("ATTACK",        None,    "1",     110,      11),
+    ("ATTACK.ten",      10,   "10",     120,      20),
+    ("ATTACK.twenty",   20,   "20",     150,      50),
+    ("ATTACK.thirty",   30,   "30",     170,      70)]
+
+# condition test cases: verb, power, stacks, expected hit, expected stacks
+_LAME_CONDITIONS = [
+    ("MENTAL",     None,    "1",     100,       1),
+    ("MENTAL.X",     10,   "10",     110,      10),
+    ("MENTAL.Y",     20,   "20",     120,      20),
+    ("MENTAL.Z",     30,   "30",     130,      30)]
+
+_SKILLED_CONDITIONS = [
+    ("MENTAL",     None,    "1",     110,      11),
+    ("MENTAL.X",     10,   "10",     120,      20),
+    ("MENTAL.Y",     20,   "20",     150,      50),
+    ("MENTAL.Z",     30,   "30",     170,      70)]
+
+
+# pylint: disable=too-many-locals; I claim I need them all
+def _run_cases(sender, cases, attacks):
+    """
+    shared driver for the table-driven attack/condition scenarios
+
+    The victim, context, and artifact (identical across scenarios)
+    are created once here, and the per-row action construction,
+    delivery, and result checking is common code.
+
+    @param sender: (Base) initiator of the test actions
+    @param cases: (list) of (verb, to-hit bonus, formula,
+                  expected TO_HIT, expected damage/stacks) rows
+    @param attacks: (boolean) rows are attacks (vs conditions)
+    @return: (tried, passed) test counts
+    """
+    victim = TestRecipient("victim")
+    context = Base("unit-test")
+    artifact = Base("test-case")
+    (hit_attr, value_attr, total_attr) = \
+        ("ACCURACY", "DAMAGE", "HIT_POINTS") if attacks \
+        else ("POWER", "STACKS", "TOTAL")
+
+    tried = 0
+    passed = 0
+    for (verb, bonus, formula, exp_hit, exp_value) in cases:
+        action = GameAction(artifact, verb)
+        if bonus is not None:
+            action.set(hit_attr, bonus)
+        action.set(value_attr, formula)
+        (_, result) = action.act(sender, victim, context)
+
+        # see if the action contained the expected values
+        tried += 3
+        to_hit = action.get("TO_HIT")
+        value = action.get(total_attr)
+        if action.verb == verb and to_hit == exp_hit and value == exp_value:
+            print(result + " ... CORRECT")
+            passed += 3
+        else:
+            print(result)
+            assert action.verb == verb, \
+                "incorrect action verb: expected " + verb
+            passed += 1
+            assert to_hit == exp_hit, \
+                "incorrect base accuracy: expected " + str(exp_hit)
+            passed += 1
+            assert value == exp_value, \
+                f"incorrect base {total_attr}: expected {exp_value}"
+            passed += 1
+    print()
+    return (tried, passed)
+
+
+def base_attacks():
+    """
+    GameAction base ability ATTACK test cases:
+        - test correctness of TO_HIT and DAMAGE computations
+          for base and sub-type attacks
+          but with no sub-type or initiator bonuses
+    """
+    lame = Base("lame attacker")        # attacker w/no skills
+    return _run_cases(lame, _LAME_ATTACKS, True)
+
+
+def subtype_attacks():
+    """
+    GameAction sub-type ability ATTACK test cases:
+        - test correctness of TO_HIT and DAMAGE computations
+          for base and sub-type attacks
+          both action and initiator have both base and sub-type bonuses
+    """
+    skilled = Base("skilled attacker")  # attacker w/many skills
+    skilled.set("ACCURACY", 10)
+    skilled.set("DAMAGE", "10")
+    skilled.set("ACCURACY.twenty", 20)
+    skilled.set("DAMAGE.twenty", "20")
+    skilled.set("ACCURACY.thirty", 30)
+    skilled.set("DAMAGE.thirty", "30")
+    return _run_cases(skilled, _SKILLED_ATTACKS, True)
+
+
+def base_conditions():
+    """
+    GameAction base ability condition test cases:
+        - test correctness of TO_HIT and STACKS computations
+          for base and sub-type verbs
+          but with no sub-type or initiator bonuses
+    """
+    lame = Base("unskilled sender")      # sender w/no skills
+    return _run_cases(lame, _LAME_CONDITIONS, False)
+
+
+def subtype_conditions():
+    """
+    GameAction sub-type ability condition test cases:
+        - test correctness of TO_HIT and STACKS computations
+          for base and sub-type verbs
+          both action and initiator have both base and sub-type bonuses
+    """
+    skilled = Base("skilled sender")  # sender w/many skills
+    skilled.set("POWER.MENTAL", 10)
+    skilled.set("STACKS.MENTAL", "10")
+    skilled.set("POWER.MENTAL.Y", 20)
+    skilled.set("STACKS.MENTAL.Y", "20")
+    skilled.set("POWER.MENTAL.Z", 30)
+    skilled.set("STACKS.MENTAL.Z", "30")
+    return _run_cases(skilled, _SKILLED_CONDITIONS, False)
+
+
+def compound_verbs():
+    """
+    GameAction compound-verb test cases:
+      - recognition and handling of compound verbs
+      - correct association with ACCURACY, DAMAGE, POWER and STACKS lists
+      - stopping list processing on first action that fails
+    """
+    context = Base("unit-test")
+    artifact = Base("test-case")
+    victim = TestRecipient("victim")
+    lame = Base("unskilled sender")      # sender w/no skills
+
+    verbs = "ATTACK.one+MENTAL.two+ATTACK.three+PHYSICAL.four+VERBAL.five" + \
+            "+FAIL+WONT-HAPPEN"
+    action = GameAction(artifact, verbs)
+    action.set("ACCURACY", "1,3")
+    action.set("DAMAGE", "10,30")
+    action.set("POWER", "2,4,5,0")
+    action.set("STACKS", "2,4,5,0")
+
+    print("Compound verb: " + verbs)
+    for attr in ["ACCURACY", "DAMAGE", "POWER", "STACKS"]:
+        print("    " + attr + ":\t" + action.get(attr))
+
+    (success, results) = action.act(lame, victim, context)
+    print(results)
+    assert "ATTACK.one (TO_HIT=101, DAMAGE=10)" in results, \
+        "ATTACK.one was not correctly passed"
+    assert "two (TO_HIT=102, STACKS=2)" in results, \
+        "MENTAL.two was not correctly passed"
+    assert "ATTACK.three (TO_HIT=103, DAMAGE=30)" in results, \
+        "ATTACK.three was not correctly passed"
+    assert "four (TO_HIT=104, STACKS=4)" in results, \
+        "PHYSICAL.four was not correctly passed"
+    assert "five (TO_HIT=105, STACKS=5)" in results, \
+        "VERBAL.five was not correctly passed"
+    assert "resists FAIL" in results, \
+        "sixth (FAIL) condition was not correctly passed"
+    assert not success, \
+        "sixth (FAIL) condition did not cause action to fail"
+    assert "WONT-HAPPEN" not in results, \
+        "seventh (WONT-HAPPEN) action should not have been sent"
+
+    print()
+    return (8, 8)
+
+
+def batch_tests():
+    """
+    GameAction act_batch test cases:
+      - deterministic TO_HIT matches the single-act computation
+      - sampled values stay within the dice formula's range
+    """
+    artifact = Base("test-case")
+    skilled = Base("skilled attacker")
+    skilled.set("ACCURACY", 10)
+    skilled.set("DAMAGE", "10")
+
+    action = GameAction(artifact, "ATTACK")
+    action.set("ACCURACY", 10)
+    action.set("DAMAGE", "3D4")
+
+    rolls = 20
+    batch = action.act_batch(skilled, rolls)
+    (verb, to_hit, samples) = batch[0]
+    print(f"act_batch({action.verb}) -> TO_HIT={to_hit},"
+          f" {rolls} samples between {min(samples)} and {max(samples)}")
+    assert verb == "ATTACK" and to_hit == 120, \
+        "act_batch returned incorrect TO_HIT"
+    assert len(samples) == rolls, \
+        "act_batch returned wrong number of samples"
+    assert min(samples) >= 13 and max(samples) <= 22, \
+        "act_batch samples outside of 3D4+10 range"
+
+    print()
+    return (3, 3)
+
+
+def _run_scenario(scenario):
+    """
+    run a single test scenario (picklable worker for a process pool)
+
+    The scenario's output is captured (rather than written to the
+    shared stdout, where concurrent workers would interleave it) so
+    that main() can print each block intact and in order.
+
+    @param scenario: (callable) test scenario to run
+    @return: ((tried, passed) test counts, (string) captured output)
+    """
+    output = StringIO()
+    with redirect_stdout(output):
+        counts = scenario()
+    return (counts, output.getvalue())
+
+
+def main():
+    """
+    Run all unit-test cases and print out summary of results
+
+    The scenarios are independent (each builds its own sender, victim
+    and context), so they run in a process pool to overlap them on CI.
+    """
+    scenarios = [base_attacks, subtype_attacks,
+                 base_conditions, subtype_conditions,
+                 compound_verbs, batch_tests]
+    with ProcessPoolExecutor(max_workers=len(scenarios)) as pool:
+        results = list(pool.map(_run_scenario, scenarios))
+    tried = 0
+    passed = 0
+    for ((t_count, p_count), output) in results:
+        print(output, end="")
+        tried += t_count
+        passed += p_count
+    if tried == passed:
+        print(f"Passed all {passed} GameAction tests")
+    else:
+        missed = tried - passed
+        print(f"FAILED {missed}/{tried} GameAction tests")
+
+
+if __name__ == "__main__":
+    main()
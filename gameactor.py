@@ -1,17 +1,83 @@
 #!/usr/bin/python3
 """ This module implements the GameActor class """
 from random import randint
-from gameobject import GameObject
+from gameobject import GameObject, parse_verb
 from gameaction import GameAction
 from gamecontext import GameContext
 
 
+def resolve_attack(to_hit, evasion, delivered, protection, old_hp,
+                   _randint=randint):
+    """
+    resolve the dice-vs-defense arithmetic for one incoming attack
+
+    This is the scalar core of C{_accept_attack}, split out so the hot
+    math runs in a single frame of plain locals, and so balance testers
+    can simulate large batches of combats without constructing actors,
+    actions, and contexts for each sample.
+
+    @param to_hit: (int) attacker's (pre-defense) to-hit score
+    @param evasion: (int) defender's total EVASION
+    @param delivered: (int) (pre-armor) HIT_POINTS being delivered
+    @param protection: (int) defender's total PROTECTION
+    @param old_hp: (int) defender's current LIFE
+    @return: (string, int) outcome ("evaded", "absorbed", or "hit")
+             and resulting LIFE
+    """
+    to_hit -= evasion
+    # a non-positive score cannot beat any D100 roll, so don't burn
+    # a PRNG draw finding that out
+    if to_hit <= 0:
+        return ("evaded", old_hp)
+    if to_hit < 100 and _randint(1, 100) > to_hit:
+        return ("evaded", old_hp)
+    if protection >= delivered:
+        return ("absorbed", old_hp)
+    return ("hit", old_hp - (delivered - protection))
+
+
+def resolve_turn(actors):
+    """
+    give each able actor (in initiative order) its turn,
+    and collect the results
+
+    This is the standard driver for a combat round: the loop body
+    holds only pre-bound locals, so the per-actor cost is the
+    take_turn call itself rather than repeated global and attribute
+    lookups at the call site.
+
+    @param actors: (list of GameActor) in initiative order
+    @return: (list of string) description of each turn taken
+    """
+    results = []
+    append = results.append
+    for actor in actors:
+        if actor.incapacitated:
+            continue
+        taken = actor.take_turn()
+        # sub-classes may return (success, description) tuples
+        if isinstance(taken, tuple):
+            taken = taken[1]
+        append(taken)
+    return results
+
+
 class GameActor(GameObject):
     """
     A GameActor (typically a PC or NPC) is an agent that has a
     context and is capable of initiating and receiving actions.
     """
 
+    # fixed instance layout (as in GameObject and Base): combat
+    # scenarios populate many actors, and the hot attribute reads
+    # (alive, incapacitated, context) become direct slot accesses
+    __slots__ = ('context', 'alive', 'incapacitated', '_defense_cache')
+
+    # map of base verb to the name of the method that processes it
+    # (sub-classes can extend this table to register new verbs,
+    #  rather than chaining comparisons in accept_action)
+    _HANDLERS = {"ATTACK": "_accept_attack"}
+
     def __init__(self, name="actor", descr=None):
         """
         create a new GameActor
@@ -22,67 +88,82 @@ class GameActor(GameObject):
         self.context = None
         self.alive = True
         self.incapacitated = False
-
-    def _accept_attack(self, action, actor, context):
+        # every actor has a LIFE total, so give it a real (zero)
+        # default and spare the attack path a per-hit None check
+        self.set("LIFE", 0)
+        # sub-type -> (EVASION, PROTECTION) totals, so that a flurry of
+        # attacks in one turn does not redo the same attribute lookups
+        # (flushed whenever a defensive attribute or the context changes)
+        self._defense_cache = {}
+
+    # pylint: disable=too-many-locals; the bindings are the point
+    def _accept_attack(self, action, actor, context, verbose=True):
         """
         Accept an attack, figure out if it hits, and how bad
         @param action: (GameAction) being performed
         @param actor: (GameActor) initiating the action
         @param context: (GameContext) in which action is being taken
+        @param verbose: (boolean) build a description of the effect
         @return:  (boolean, string) succewss and description of the effect
 
         """
 
-        # get the victim's base and sub-type EVASION
-        evade = self.get("EVASION")
-        evasion = 0 if evade is None else int(evade)
-        if "ATTACK." in action.verb:
-            evade = self.get("EVASION." + action.verb.split(".")[1])
-            if evade is not None:
-                evasion += int(evade)
-
-        # see if EVASION+D100 can beat the incoming TO_HIT
-        to_hit = action.get("TO_HIT") - evasion
-        if to_hit < 100 and randint(1, 100) > to_hit:
-            return (False,
-                    f"{self.name} evades {action.source.name} {action.verb}")
-
-        # get the recipient's base and sub-class PROTECTION
-        prot = self.get("PROTECTION")
-        protection = 0 if prot is None else int(prot)
-        if "ATTACK." in action.verb:
-            prot = self.get("PROTECTION." + action.verb.split(".")[1])
-            if prot is not None:
-                protection += int(prot)
-
-        # see if PROTECTION can absorb all the incoming HIT_POINTS
+        # bind the repeatedly referenced attributes as locals, so the
+        # formatting below does fast-local loads rather than attribute
+        # traversals
+        verb = action.verb
+
+        # get the victim's base and sub-type EVASION and PROTECTION
+        # (cached, as they do not change over a turn's worth of attacks)
+        (_, sub_type) = parse_verb(verb)
+        defense = self._defense_cache.get(sub_type)
+        if defense is None:
+            defense = (self.get_total("EVASION", sub_type),
+                       self.get_total("PROTECTION", sub_type))
+            self._defense_cache[sub_type] = defense
+        (evasion, protection) = defense
+
+        # pit TO_HIT and HIT_POINTS against EVASION and PROTECTION
         delivered = action.get("HIT_POINTS")
-        if protection >= delivered:
+        # LIFE is initialized in __init__, so no None check is needed
+        old_hp = self.get("LIFE")
+        (outcome, new_hp) = resolve_attack(action.get("TO_HIT"), evasion,
+                                           delivered, protection, old_hp)
+        if outcome == "evaded":
+            if not verbose:
+                return (False, "")
+            return (False,
+                    f"{self.name} evades {action.source.name} {verb}")
+        if outcome == "absorbed":
+            if not verbose:
+                return (False, "")
             return (False,
                     f"{self.name}'s protection absorbs all damage from"
-                    f" {action.verb}")
+                    f" {verb}")
 
         # subtract received HIT_POINTS from our LIFE
-        old_hp = self.get("LIFE")
-        if old_hp is None:
-            old_hp = 0
-        new_hp = old_hp - (delivered - protection)
         self.set("LIFE", new_hp)
 
-        taken = delivered - protection
-        result = f"{self.name} hit by {action.verb} from {actor.name}" +\
-                 f" using {action.source.name} for {delivered}-{protection}" +\
-                 f" life-points in {context.name}" +\
-                 f"\n    {self.name} life: {old_hp} - {taken} = {new_hp}"
+        if verbose:
+            name = self.name
+            taken = delivered - protection
+            result = f"{name} hit by {verb} from {actor.name}" +\
+                     f" using {action.source.name}" +\
+                     f" for {delivered}-{protection}" +\
+                     f" life-points in {context.name}" +\
+                     f"\n    {name} life: {old_hp} - {taken} = {new_hp}"
+        else:
+            result = ""
 
         # if LIFE<=0 we are incapacitated, and no longer alive
         if new_hp <= 0:
-            result += ", and is killed"
+            if verbose:
+                result += ", and is killed"
             self.alive = False
             self.incapacitated = True
         return (True, result)
 
-    def accept_action(self, action, actor, context):
+    def accept_action(self, action, actor, context, verbose=True):
         """
         receive and process the effects of an ATTACK
         (other actions are passed to our super-class)
@@ -98,18 +179,20 @@ class GameActor(GameObject):
         @param action: (GameAction) being performed
         @param actor: (GameActor) initiating the action
         @param context: (GameContext) in which action is being taken
+        @param verbose: (boolean) build a description of the effect
         @return:  (boolean, string) description of the effect
         """
         # get the base action verb
-        base_verb = action.verb.split('.')[0] \
-            if '.' in action.verb else action.verb
+        (base_verb, _) = parse_verb(action.verb)
 
-        # we handle ATTACK (based on HIT/DAMAGE vs EVASION/PROTECTION)
-        if base_verb == "ATTACK":
-            return self._accept_attack(action, actor, context)
+        # dispatch any verb with a registered handler
+        # (e.g. ATTACK, based on HIT/DAMAGE vs EVASION/PROTECTION)
+        handler = self._HANDLERS.get(base_verb)
+        if handler is not None:
+            return getattr(self, handler)(action, actor, context, verbose)
 
         # otherwise let our (GameObject) super-class handle it
-        return super().accept_action(action, actor, context)
+        return super().accept_action(action, actor, context, verbose)
 
     def interact(self, actor):
         """
@@ -130,19 +213,31 @@ class GameActor(GameObject):
         """
         interactions = GameObject("interactions w/" + actor.name)
         verbs = self.get("INTERACTIONS")
-        actions = ""
-        if verbs is not None:
-            for verb in verbs.split(','):
-                actions += "VERBAL." if actions == "" else ",VERBAL."
-                actions += verb
+        # one join pass, rather than (quadratic) repeated concatenation
+        actions = "" if verbs is None else \
+            ",".join("VERBAL." + verb for verb in verbs.split(','))
         interactions.set("ACTIONS", actions)
         return interactions
 
+    def set(self, attribute, value):
+        """
+        set the value of an attribute
+        (flushing cached defense totals if one of them changes)
+
+        @param attribute: name of attribute to be fetched
+        @param value: value to be stored for that attribute
+        """
+        if attribute.startswith("EVASION") or \
+                attribute.startswith("PROTECTION"):
+            self._defense_cache.clear()
+        super().set(attribute, value)
+
     def set_context(self, context):
         """
         establish the local context
         """
         self.context = context
+        self._defense_cache.clear()
 
     def take_action(self, action, target):
         """
@@ -447,6 +542,70 @@ def random_condition_tests():
     return (2, 2)
 
 
+def turn_tests():
+    """
+    resolve_turn gives a turn to every actor still standing
+    """
+    actors = [GameActor("able-1"), GameActor("downed"), GameActor("able-2")]
+    actors[1].incapacitated = True
+
+    results = resolve_turn(actors)
+    print(f"resolve_turn({[a.name for a in actors]}) -> {results}")
+    assert len(results) == 2, \
+        "resolve_turn did not skip incapacitated actors"
+    assert results[0] == "able-1 takes no action", \
+        "resolve_turn returned incorrect turn description"
+
+    print()
+    return (2, 2)
+
+
+# pylint: disable=too-many-locals; one pair per test scenario
+def verbose_tests():
+    """
+    verbose=False suppresses descriptions, but not side effects
+    """
+    attacker = GameActor("attacker")
+    target = GameActor("target")
+    context = GameContext("unit-test")
+
+    tried = 0
+    passed = 0
+
+    # a quiet hit still costs LIFE, but returns no description
+    source = GameObject("sure-thing")
+    action = GameAction(source, "ATTACK")
+    action.set("TO_HIT", 110)
+    action.set("HIT_POINTS", 3)
+    target.set("LIFE", 10)
+    (success, desc) = target.accept_action(action, attacker, context,
+                                           verbose=False)
+    print(f"quiet {action.verb} on {target}:"
+          f" success={success}, desc='{desc}', LIFE={target.get('LIFE')}")
+    tried += 3
+    assert success, "non-verbose attack did not hit"
+    assert desc == "", "non-verbose attack returned a description"
+    assert target.get("LIFE") == 7, "non-verbose attack did not cost LIFE"
+    passed += 3
+
+    # a quiet killing blow still incapacitates
+    action.set("HIT_POINTS", 20)
+    (success, desc) = target.accept_action(action, attacker, context,
+                                           verbose=False)
+    print(f"quiet {action.verb} on {target}:"
+          f" success={success}, desc='{desc}', alive={target.alive}")
+    tried += 3
+    assert success and desc == "", \
+        "non-verbose killing blow returned a description"
+    assert not target.alive, "non-verbose killing blow left target alive"
+    assert target.incapacitated, \
+        "non-verbose killing blow did not incapacitate target"
+    passed += 3
+
+    print()
+    return (tried, passed)
+
+
 def main():
     """
     Run all unit-test cases and print out summary of results
@@ -457,8 +616,10 @@ def main():
     (t_4, p_4) = simple_condition_tests()
     (t_5, p_5) = sub_condition_tests()
     (t_6, p_6) = random_condition_tests()
-    tried = t_1 + t_2 + t_3 + t_4 + t_5 + t_6
-    passed = p_1 + p_2 + p_3 + p_4 + p_5 + p_6
+    (t_7, p_7) = turn_tests()
+    (t_8, p_8) = verbose_tests()
+    tried = t_1 + t_2 + t_3 + t_4 + t_5 + t_6 + t_7 + t_8
+    passed = p_1 + p_2 + p_3 + p_4 + p_5 + p_6 + p_7 + p_8
     if tried == passed:
         print(f"Passed all {passed} GameActor tests")
     else:
@@ -10,6 +10,9 @@ class GameContext(GameObject):
     higherarchical relationships (e.g. kingdom, village, buiding, room).
     """
 
+    # fixed instance layout (as in GameObject and Base)
+    __slots__ = ('parent', 'party', 'npcs')
+
     def __init__(self, name="context", descr=None, parent=None):
         """
         create a new GameObject
@@ -31,11 +34,10 @@ class GameContext(GameObject):
         @param attribute: name of attribute to be fetched
         @return: (string) value (or None)
         """
-        if attribute in self.attributes:
-            return self.attributes[attribute]
-        if self.parent is not None:
+        value = self.attributes.get(attribute)
+        if value is None and self.parent is not None:
             return self.parent.get(attribute)
-        return None
+        return value
 
     def possible_actions(self, actor, context):
         """
@@ -51,7 +53,7 @@ class GameContext(GameObject):
         actions = super().possible_actions(actor, context)
         return actions
 
-    def accept_action(self, action, actor, context):
+    def accept_action(self, action, actor, context, verbose=True):
         """
         receive and process the effects of an action
 
@@ -61,6 +63,7 @@ class GameContext(GameObject):
         @param action: GameAction being performed
         @param actor: GameActor initiating the action
         @param context: GameContext in which the action is happening
+        @param verbose: (boolean) build a description of the effect
 
         @return: (boolean success, string description of the effect)
         """
@@ -74,7 +77,7 @@ class GameContext(GameObject):
                 if concealment is not None and concealment > 0:
                     # pass the SEARCH action on to that object
                     (success, descr) = thing.accept_action(action, actor,
-                                                           context)
+                                                           context, verbose)
                     if success:
                         found_stuff = True
                     if result == "":
@@ -84,7 +87,7 @@ class GameContext(GameObject):
             return (found_stuff, result)
 
         # if we don't recognize this action, pass it up the chain
-        return super().accept_action(action, actor, context)
+        return super().accept_action(action, actor, context, verbose)
 
     def get_party(self):
         """
@@ -383,6 +386,14 @@ def get_tests():
         "get() of non-existent value returns " + str(ret)
     passed += 1
 
+    print("get_int follows parents and coerces to int")
+    c_1.set("DEPTH", "4")
+    ret = c_3.get_int("DEPTH")
+    tried += 1
+    assert ret == 4, \
+        "child.get_int() does not return grand-parent's value"
+    passed += 1
+
     print()
     return (tried, passed)
 
@@ -392,6 +403,9 @@ class TestObject(GameObject):
     A TestObject is a hidden object that will be found after a
     specified number of searches.
     """
+
+    __slots__ = ()
+
     def __init__(self, name, searches):
         """
         a TestObject will be hidden for a specified number of searches,
@@ -404,7 +418,7 @@ class TestObject(GameObject):
         self.set("RESISTANCE.SEARCH", searches)
         self.set("SEARCHES", 0)
 
-    def accept_action(self, action, actor, context):
+    def accept_action(self, action, actor, context, verbose=True):
         """
         receive and process the effects of an action
 
@@ -414,6 +428,7 @@ class TestObject(GameObject):
         @param action: GameAction being performed
         @param actor: GameActor initiating the action
         @param context: GameContext in which the action is happening
+        @param verbose: (boolean) build a description of the effect
 
         @return: (boolean success, string description of the effect)
         """
@@ -425,8 +440,8 @@ class TestObject(GameObject):
         self.set("SEARCHES", searches)
 
         if searches >= resistance:
-            return (True, self.name)
-        return (False, "!" + self.name)
+            return (True, self.name if verbose else "")
+        return (False, ("!" + self.name) if verbose else "")
 
 
 def search_tests():
@@ -483,6 +498,14 @@ def search_tests():
         "third search returned " + descr
     passed += 2
 
+    print("fourth (non-verbose) search succeeds without a description")
+    (success, descr) = cxt.accept_action(search, None, cxt, verbose=False)
+    tried += 2
+    assert success, "non-verbose SEARCH failed"
+    assert descr == "", \
+        "non-verbose SEARCH returned a description: " + descr
+    passed += 2
+
     print()
 
     return (tried, passed)
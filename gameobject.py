@@ -1,11 +1,30 @@
 #!/usr/bin/python3
 """ This module implements the (foundation) GameObject Class """
 import sys
+from functools import lru_cache
 from random import randint
-from base import Base
+from base import Base, compound_key
 from gameaction import GameAction
 
 
+@lru_cache(maxsize=256)
+def parse_verb(verb):
+    """
+    split a (possibly sub-typed) verb into its base verb and sub-type
+
+    Verbs are immutable and drawn from a small vocabulary, but they are
+    re-parsed on every action delivery.  Caching the decomposition turns
+    the repeated split (and its list allocation) into a dict lookup.
+
+    @param verb: (string) simple or sub-typed verb
+    @return: (base verb, sub-type) ... sub-type is None if verb is simple
+    """
+    if '.' in verb:
+        parts = verb.split('.')
+        return (parts[0], parts[1])
+    return (verb, None)
+
+
 class GameObject(Base):
     """
     This is the base class for all artifacts, actors, and contexts.
@@ -18,6 +37,14 @@ class GameObject(Base):
 
     objects can be I{hidden} in which case they might not be returned
     """
+
+    # fixed instance layout (as in Base): populations of objects are
+    # much cheaper without a per-instance __dict__
+    # NOTE: 'verb' is not set by this class, but ad-hoc action-like
+    #       objects (e.g. the SEARCH operation in the gamecontext
+    #       tests) assign one, so the layout leaves room for it
+    __slots__ = ('objects', 'verb')
+
     def __init__(self, name="actor", descr=None):
         """
         create a new GameObject
@@ -84,7 +111,7 @@ class GameObject(Base):
             self.objects.append(item)
 
     # pylint: disable=too-many-locals
-    def accept_action(self, action, actor, context):
+    def accept_action(self, action, actor, context, verbose=True):
         """
         called by C{GameAction.act()} to receive GameAction, determine effects
 
@@ -96,44 +123,41 @@ class GameObject(Base):
         @param action: GameAction being performed
         @param actor: GameActor initiating the action
         @param context: GameContext in which action is occuring
+        @param verbose: (boolean) build a description of the effect
 
             NOTE: this base class makes no use of the C{actor} or C{context}
             parameters, but they might be useful to a subc-class that could
             process actions before passing them down to us.
 
+            Simulation loops that only care about success can pass
+            C{verbose=False} to skip all result-string construction.
+
         @return: <(boolean) success, (string) description of the effect>
         """
         # get the base verb and sub-type
-        if '.' in action.verb:
-            base_verb = action.verb.split('.')[0]
-            sub_type = action.verb.split('.')[1]
-        else:
-            base_verb = action.verb
-            sub_type = None
-
-        # look up our base resistance
-        res = self.get("RESISTANCE")
-        resistance = 0 if res is None else int(res)
-
-        # see if we have a RESISTANCE.base-verb
-        res = self.get("RESISTANCE." + base_verb)
-        if res is not None:
-            resistance += int(res)
+        (base_verb, sub_type) = parse_verb(action.verb)
 
-        # see if we have a RESISTANCE.base-verb.subtype
+        # sum our base, base-verb, and base-verb.subtype RESISTANCE
+        resistance = self.get_total("RESISTANCE", base_verb)
         if sub_type is not None:
-            res = self.get("RESISTANCE." + base_verb + "." + sub_type)
+            res = self.get(compound_key("RESISTANCE",
+                                        compound_key(base_verb, sub_type)))
             if res is not None:
                 resistance += int(res)
 
         # if sum of RESISTANCE >= TO_HIT, action has been resisted
-        power = int(action.get("TO_HIT")) - resistance
+        #   (TO_HIT and TOTAL are coerced to int when GameAction.act
+        #    computes them, so no per-call conversion is needed here)
+        power = action.get("TO_HIT") - resistance
         if power <= 0:
+            if not verbose:
+                return (False, "")
             return (False,
                     f"{self.name} resists {action.source.name} {action.verb}")
 
         # for each STACK instance, roll to see if roll+RESISTANCE > TO_HIT
-        incoming = abs(int(action.get("TOTAL")))
+        total = action.get("TOTAL")
+        incoming = abs(total)
         received = 0
         for _ in range(incoming):
             roll = randint(1, 100)
@@ -143,7 +167,7 @@ class GameObject(Base):
 
         # add number of successful STACKS to affected attribute
         #   (or if C{GameAction.TOTAL} is negative, subtract)
-        sign = 1 if int(action.get("TOTAL")) > 0 else -1
+        sign = 1 if total > 0 else -1
         if received > 0:
             have = self.get(action.verb)
             have = 0 if have is None else int(have)
@@ -155,6 +179,8 @@ class GameObject(Base):
             self.set(action.verb, have + (sign * received))
 
         # return <whether or not any succeed, accumulated results>
+        if not verbose:
+            return (received > 0, "")
         delivered = incoming - received
         neg = "(negative) " if sign < 0 else ""
         return (received > 0,
@@ -199,19 +225,19 @@ class GameObject(Base):
             action = GameAction(self, compound_verb)
 
             # accumulate base and sub-type attributes
-            accuracies = ""
-            damages = ""
-            powers = ""
-            stacks = ""
+            accuracies = []
+            damages = []
+            powers = []
+            stacks = []
 
             # if a verb is compound (+), accumulate each sub-verb separately
             for verb in compound_verb.split('+'):
-                if verb.startswith("ATTACK"):
+                (base_verb, sub_type) = parse_verb(verb)
+                if base_verb == "ATTACK":
                     # see if we have ATTACK sub-type ACCURACY/DAMAGE
                     sub_accuracy = None
                     sub_damage = None
-                    if verb.startswith('ATTACK.'):
-                        sub_type = verb.split('.')[1]
+                    if sub_type is not None:
                         sub_accuracy = self.get("ACCURACY." + sub_type)
                         sub_damage = self.get("DAMAGE." + sub_type)
 
@@ -220,10 +246,7 @@ class GameObject(Base):
                         else int(base_accuracy)
                     accuracy += 0 if sub_accuracy is None \
                         else int(sub_accuracy)
-                    if accuracies == "":
-                        accuracies = str(accuracy)
-                    else:
-                        accuracies += "," + str(accuracy)
+                    accuracies.append(str(accuracy))
 
                     # FIX GameAction.DAMAGE could be a (non-addable) D-formula
                     if sub_damage is not None:
@@ -232,19 +255,13 @@ class GameObject(Base):
                         damage = base_damage
                     else:
                         damage = 0
-                    if damages == "":
-                        damages = str(damage)
-                    else:
-                        damages += "," + str(damage)
+                    damages.append(str(damage))
                 else:
                     # see if we have verb sub-type POWER/STACKS
                     sub_power = self.get("POWER." + verb)
                     power = 0 if base_power is None else int(base_power)
                     power += 0 if sub_power is None else int(sub_power)
-                    if powers == "":
-                        powers = str(power)
-                    else:
-                        powers += "," + str(power)
+                    powers.append(str(power))
 
                     # FIX GameAction.STACKS could be a (non-addable) D-formula
                     sub_stacks = self.get("STACKS." + verb)
@@ -254,20 +271,17 @@ class GameObject(Base):
                         stack = base_stacks
                     else:
                         stack = 1
-                    if stacks == "":
-                        stacks = str(stack)
-                    else:
-                        stacks += "," + str(stack)
-
-                # add accumulated ACCURACY/DAMAGE/POWER/STACKS to C{GameAction}
-                if accuracies != "":
-                    action.set("ACCURACY", accuracies)
-                if damages != "":
-                    action.set("DAMAGE", damages)
-                if powers != "":
-                    action.set("POWER", powers)
-                if stacks != "":
-                    action.set("STACKS", stacks)
+                    stacks.append(str(stack))
+
+            # add accumulated ACCURACY/DAMAGE/POWER/STACKS to C{GameAction}
+            if accuracies:
+                action.set("ACCURACY", ",".join(accuracies))
+            if damages:
+                action.set("DAMAGE", ",".join(damages))
+            if powers:
+                action.set("POWER", ",".join(powers))
+            if stacks:
+                action.set("STACKS", ",".join(stacks))
 
             # append the new C{GameAction} to the list to be returned
             actions.append(action)
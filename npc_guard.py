@@ -12,6 +12,10 @@ class NPC_guard(GameActor):
     A guard is a low-level NPC fighter who will quickly
     engage and can call for reinforcements.
     """
+
+    # fixed instance layout (as in GameActor and its ancestors)
+    __slots__ = ('weapon', 'help_arrived', 'target')
+
     def __init__(self, name="guard", descr=None):
         """
         create a new GameObject
@@ -38,13 +42,14 @@ class NPC_guard(GameActor):
         self.help_arrived = False
         self.target = None
 
-    def accept_action(self, action, actor, context):
+    def accept_action(self, action, actor, context, verbose=True):
         """
         receive and process the effects of an action
 
         @param action: GameAction being performed
         @param actor: GameActor) initiating the action
         @param context: GameContext in which action is being taken
+        @param verbose: (boolean) build a description of the effect
         @return: (boolean success, string description of the effect)
 
         The only special things about a guard ar that, if attacked
@@ -56,7 +61,7 @@ class NPC_guard(GameActor):
         self.context = context
 
         # start with standard GameActor responses
-        (hit, desc) = super().accept_action(action, actor, context)
+        (hit, desc) = super().accept_action(action, actor, context, verbose)
 
         # figure out the action verb and sub-type
         if '.' in action.verb:
@@ -72,12 +77,14 @@ class NPC_guard(GameActor):
 
             # see if we can call for help
             if self.get("reinforcements") > 0 and not self.help_arrived:
-                desc += "\n    " + self.name + " calls for help"
+                if verbose:
+                    desc += "\n    " + self.name + " calls for help"
                 roll = randint(1, 100)
                 if roll <= self.get("reinforcements"):
                     helper = NPC_guard("Guard #2", "test reinforcement")
                     helper.target = actor
-                    desc += ", and " + helper.name + " arrives"
+                    if verbose:
+                        desc += ", and " + helper.name + " arrives"
                     context.add_npc(helper)
                     helper.set_context(context)
                     self.help_arrived = True
@@ -122,15 +129,18 @@ class NoGoodNick(GameActor):
         self.set("DAMAGE", "D6")
         self.set("ACTIONS", "ATTACK.BRAWL")
 
-    def accept_action(self, action, actor, context):
+    def accept_action(self, action, actor, context, verbose=True):
         """
         receive an attack and report who made it
 
         @param action: GameAction being performed
         @param actor: GameActor) initiating the action
         @param context: GameContext in which action is being taken
+        @param verbose: (boolean) build a description of the effect
         @return: (boolean success, string description of the effect)
         """
+        if not verbose:
+            return (True, "")
         return (True, f"{actor.name} counter-attacks {self.name}")
 
 